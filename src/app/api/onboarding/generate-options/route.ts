@@ -1,18 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
-import Anthropic from '@anthropic-ai/sdk'
-import { createClient } from '@supabase/supabase-js'
-
-// Initialize Supabase admin client for caching
-const supabaseAdmin = createClient(
-  process.env.NEXT_PUBLIC_SUPABASE_URL!,
-  process.env.SUPABASE_SERVICE_ROLE_KEY!,
-  {
-    auth: {
-      autoRefreshToken: false,
-      persistSession: false
-    }
-  }
-)
+import { createAdminClient } from '@/lib/supabase/admin'
 
 // System prompt for the onboarding agent
 const SYSTEM_PROMPT = `You are an expert at understanding professional roles and generating relevant, specific options for user onboarding.
@@ -26,6 +13,11 @@ Guidelines:
 - Generate exactly 5-6 options
 - Make each option distinct and actionable`
 
+// Bound LLM latency so a slow or hung request falls back to default options
+// instead of leaving onboarding waiting on the SDK's 10 minute default
+const LLM_TIMEOUT_MS = 15_000
+const LLM_MAX_RETRIES = 1
+
 // Semi-dynamic team context options based on role
 const TEAM_CONTEXT_OPTIONS: Record<string, string[]> = {
   'Software Engineer': [
@@ -72,16 +64,45 @@ const TEAM_CONTEXT_OPTIONS: Record<string, string[]> = {
   ],
 }
 
+// Generic options used when generation fails or no role-specific set exists
+const FALLBACK_OPTIONS: Record<string, string[]> = {
+  team: [
+    'Solo contributor',
+    'Small team (2-10)',
+    'Medium team (10-50)',
+    'Large organization (50+)',
+    'Distributed team',
+  ],
+  tasks: [
+    'Product development',
+    'Team collaboration',
+    'Strategic planning',
+    'Code reviews',
+    'Client meetings',
+    'Documentation',
+  ],
+  tools: [
+    'Slack',
+    'Google Workspace',
+    'Jira',
+    'GitHub',
+    'Notion',
+    'Zoom',
+    'Figma',
+    'VS Code',
+  ],
+  problems: [
+    'Process inefficiency',
+    'Tool fragmentation',
+    'Scaling challenges',
+    'Communication gaps',
+    'Data silos',
+    'Manual workflows',
+  ],
+}
+
 function getTeamContextOptions(role: string): string[] {
-  return (
-    TEAM_CONTEXT_OPTIONS[role] || [
-      'Solo contributor',
-      'Small team (2-10)',
-      'Medium team (10-50)',
-      'Large organization (50+)',
-      'Distributed team',
-    ]
-  )
+  return TEAM_CONTEXT_OPTIONS[role] || FALLBACK_OPTIONS.team
 }
 
 // Build cache key from context
@@ -113,7 +134,8 @@ async function getCachedOptions(cacheKey: string): Promise<string[] | null> {
   try {
     console.log(`🔍 Looking up cache for key: ${cacheKey}`)
     
-    const { data, error } = await supabaseAdmin
+    const supabase = createAdminClient()
+    const { data, error } = await supabase
       .from('options_cache')
       .select('options, hit_count')
       .eq('cache_key', cacheKey)
@@ -137,7 +159,7 @@ async function getCachedOptions(cacheKey: string): Promise<string[] | null> {
     console.log(`✅ Cache HIT: ${cacheKey} (hit count: ${data.hit_count})`)
 
     // Update hit count and last_used_at asynchronously (don't wait)
-    supabaseAdmin
+    supabase
       .from('options_cache')
       .update({
         hit_count: (data.hit_count || 0) + 1,
@@ -156,6 +178,8 @@ async function getCachedOptions(cacheKey: string): Promise<string[] | null> {
 }
 
 // Store options in cache
+// Callers don't await this: it never throws, and the cache write shouldn't
+// delay streaming options back to the user
 async function setCachedOptions(
   cacheKey: string,
   step: string,
@@ -166,13 +190,16 @@ async function setCachedOptions(
     const role = context.role || 'unknown'
     const industry = normalizeIndustry(context.industry)
     
-    console.log(`💾 Storing in cache: ${cacheKey}`)
-    console.log(`   - Step: ${step}`)
-    console.log(`   - Role: ${role}`)
-    console.log(`   - Industry: ${industry}`)
-    console.log(`   - Options count: ${options.length}`)
+    console.log(
+      `💾 Storing in cache: ${cacheKey}\n` +
+      `   - Step: ${step}\n` +
+      `   - Role: ${role}\n` +
+      `   - Industry: ${industry}\n` +
+      `   - Options count: ${options.length}`
+    )
     
-    const { data, error } = await supabaseAdmin
+    const supabase = createAdminClient()
+    const { error } = await supabase
       .from('options_cache')
       .upsert(
         {
@@ -188,15 +215,12 @@ async function setCachedOptions(
           onConflict: 'cache_key'
         }
       )
-      .select()
     
     if (error) {
       console.error('❌ Cache storage error:', error)
       console.error('Error details:', JSON.stringify(error, null, 2))
-    } else if (data && data.length > 0) {
-      console.log(`✅ Successfully cached options for ${cacheKey}`)
     } else {
-      console.warn(`⚠️ Cache upsert returned no data for ${cacheKey}`)
+      console.log(`✅ Successfully cached options for ${cacheKey}`)
     }
   } catch (error) {
     console.error('❌ Cache storage exception:', error)
@@ -270,9 +294,14 @@ Return as a JSON array of strings.`
 }
 
 export async function POST(req: NextRequest) {
+  // Declared outside the try so the error path can fall back for the right step
+  // (the request body can't be read a second time)
+  let step: string | undefined
+
   try {
     const body = await req.json()
-    const { step, context } = body
+    step = body.step
+    const { context } = body
 
     if (!step) {
       return NextResponse.json({ error: 'Step is required' }, { status: 400 })
@@ -295,7 +324,7 @@ export async function POST(req: NextRequest) {
         const hardcodedOptions = getTeamContextOptions(context.role)
         console.log(`Using hardcoded team options for ${context.role}`)
         // Cache the hardcoded options for next time
-        await setCachedOptions(cacheKey, step, context, hardcodedOptions)
+        setCachedOptions(cacheKey, step, context, hardcodedOptions)
         return streamOptions(hardcodedOptions, true)
       }
       
@@ -303,14 +332,16 @@ export async function POST(req: NextRequest) {
       
       // Generate with LLM
       const prompt = buildPrompt(step, context)
-      
-      // Debug logging
-      console.log('Context received:', JSON.stringify(context, null, 2))
-      console.log('Prompt:', prompt)
+
+      // Load the SDK only when we actually generate, so cache hits and
+      // hardcoded options don't pay for it on cold start
+      const { default: Anthropic } = await import('@anthropic-ai/sdk')
 
       // Initialize Anthropic client per request to ensure env vars are loaded
       const anthropic = new Anthropic({
         apiKey: process.env.ANTHROPIC_API_KEY,
+        timeout: LLM_TIMEOUT_MS,
+        maxRetries: LLM_MAX_RETRIES,
       })
 
       const message = await anthropic.messages.create({
@@ -330,7 +361,7 @@ export async function POST(req: NextRequest) {
       if (!message.content || message.content.length === 0) {
         console.error('Claude returned no content')
         const fallbackOptions = getFallbackOptions(step)
-        await setCachedOptions(cacheKey, step, context, fallbackOptions)
+        setCachedOptions(cacheKey, step, context, fallbackOptions)
         return streamOptions(fallbackOptions, true)
       }
 
@@ -338,7 +369,7 @@ export async function POST(req: NextRequest) {
       if (message.stop_reason === 'refusal') {
         console.log('Claude refused the request, using fallback')
         const fallbackOptions = getFallbackOptions(step)
-        await setCachedOptions(cacheKey, step, context, fallbackOptions)
+        setCachedOptions(cacheKey, step, context, fallbackOptions)
         return streamOptions(fallbackOptions, true)
       }
 
@@ -347,13 +378,11 @@ export async function POST(req: NextRequest) {
       if (!textContent || textContent.type !== 'text') {
         console.error('No text content in Claude response')
         const fallbackOptions = getFallbackOptions(step)
-        await setCachedOptions(cacheKey, step, context, fallbackOptions)
+        setCachedOptions(cacheKey, step, context, fallbackOptions)
         return streamOptions(fallbackOptions, true)
       }
 
       // Parse the JSON response
-      console.log('Raw Claude response:', textContent.text)
-      
       let options: string[] = []
       try {
         // Strip markdown code fences if present (```json ... ``` or ``` ... ```)
@@ -389,8 +418,8 @@ export async function POST(req: NextRequest) {
         options = getFallbackOptions(step)
       }
       
-      // Store in cache for future use
-      await setCachedOptions(cacheKey, step, context, options)
+      // Store in cache for future use (don't wait)
+      setCachedOptions(cacheKey, step, context, options)
 
       // Stream options to frontend
       return streamOptions(options, false)
@@ -401,8 +430,7 @@ export async function POST(req: NextRequest) {
     console.error('Error generating options:', error)
 
     // Return fallback options on error
-    const { step } = await req.json().catch(() => ({ step: 'tasks' }))
-    const fallbackOptions = getFallbackOptions(step)
+    const fallbackOptions = getFallbackOptions(step || 'tasks')
 
     return streamOptions(fallbackOptions, true)
   }
@@ -450,41 +478,5 @@ function streamOptions(options: string[], isCached: boolean) {
 }
 
 function getFallbackOptions(step: string): string[] {
-  const fallbacks: Record<string, string[]> = {
-    team: [
-      'Solo contributor',
-      'Small team (2-10)',
-      'Medium team (10-50)',
-      'Large organization (50+)',
-      'Distributed team',
-    ],
-    tasks: [
-      'Product development',
-      'Team collaboration',
-      'Strategic planning',
-      'Code reviews',
-      'Client meetings',
-      'Documentation',
-    ],
-    tools: [
-      'Slack',
-      'Google Workspace',
-      'Jira',
-      'GitHub',
-      'Notion',
-      'Zoom',
-      'Figma',
-      'VS Code',
-    ],
-    problems: [
-      'Process inefficiency',
-      'Tool fragmentation',
-      'Scaling challenges',
-      'Communication gaps',
-      'Data silos',
-      'Manual workflows',
-    ],
-  }
-
-  return fallbacks[step] || ['General option 1', 'General option 2', 'General option 3']
+  return FALLBACK_OPTIONS[step] || ['General option 1', 'General option 2', 'General option 3']
 }
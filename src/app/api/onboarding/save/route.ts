@@ -22,7 +22,9 @@ export async function POST(req: NextRequest) {
     const supabase = createAdminClient()
 
     // Upsert the onboarding progress
-    const { data, error } = await supabase
+    // No .select() here: this runs on every step and the client never reads
+    // the row back, so skip returning the growing conversation_history
+    const { error } = await supabase
       .from('onboarding_profiles')
       .upsert(
         {
@@ -41,8 +43,6 @@ export async function POST(req: NextRequest) {
           onConflict: 'client_id',
         }
       )
-      .select()
-      .single()
 
     if (error) {
       console.error('Error saving onboarding progress:', error)
@@ -52,7 +52,7 @@ export async function POST(req: NextRequest) {
       )
     }
 
-    return NextResponse.json({ success: true, data })
+    return NextResponse.json({ success: true })
   } catch (error) {
     console.error('Error in onboarding save route:', error)
     return NextResponse.json(
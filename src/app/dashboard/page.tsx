@@ -36,6 +36,21 @@ interface Story {
   aiTags: string[]
 }
 
+// Clean, minimal color scheme for content types
+const CONTENT_TYPE_COLORS: Record<ContentType, string> = {
+  'Research': 'bg-purple-50 text-purple-700 border-purple-200',
+  'Opinion': 'bg-amber-50 text-amber-700 border-amber-200',
+  'Learning/Educational': 'bg-blue-50 text-blue-700 border-blue-200',
+  'News': 'bg-red-50 text-red-700 border-red-200',
+  'Case Study': 'bg-emerald-50 text-emerald-700 border-emerald-200',
+  'Event Coverage': 'bg-pink-50 text-pink-700 border-pink-200',
+  'Review/Benchmark': 'bg-indigo-50 text-indigo-700 border-indigo-200',
+  'Interview/Profile': 'bg-cyan-50 text-cyan-700 border-cyan-200',
+  'Dataset/Resource': 'bg-teal-50 text-teal-700 border-teal-200',
+  'Discussion': 'bg-orange-50 text-orange-700 border-orange-200',
+  'Regulatory/Policy': 'bg-slate-50 text-slate-700 border-slate-300'
+}
+
 export default function DashboardPage() {
   const router = useRouter()
   const [isVisible, setIsVisible] = useState(false)
@@ -173,21 +188,6 @@ export default function DashboardPage() {
   const featuredStories = allStories.slice(0, 8)
   const remainingStories = allStories.slice(8)
 
-  // Clean, minimal color scheme for content types
-  const contentTypeColors: Record<ContentType, string> = {
-    'Research': 'bg-purple-50 text-purple-700 border-purple-200',
-    'Opinion': 'bg-amber-50 text-amber-700 border-amber-200',
-    'Learning/Educational': 'bg-blue-50 text-blue-700 border-blue-200',
-    'News': 'bg-red-50 text-red-700 border-red-200',
-    'Case Study': 'bg-emerald-50 text-emerald-700 border-emerald-200',
-    'Event Coverage': 'bg-pink-50 text-pink-700 border-pink-200',
-    'Review/Benchmark': 'bg-indigo-50 text-indigo-700 border-indigo-200',
-    'Interview/Profile': 'bg-cyan-50 text-cyan-700 border-cyan-200',
-    'Dataset/Resource': 'bg-teal-50 text-teal-700 border-teal-200',
-    'Discussion': 'bg-orange-50 text-orange-700 border-orange-200',
-    'Regulatory/Policy': 'bg-slate-50 text-slate-700 border-slate-300'
-  }
-
   return (
     <div className="h-screen bg-gradient-to-br from-slate-50 via-white to-slate-100 relative overflow-hidden">
       {/* Enhanced Gradient Background Effects - Same as onboarding */}
@@ -363,7 +363,7 @@ export default function DashboardPage() {
 
                       {/* Content Type Tag */}
                       <div className="mb-3">
-                        <span className={`inline-block px-3 py-1 text-xs font-medium rounded-full border ${contentTypeColors[story.contentType]}`}>
+                        <span className={`inline-block px-3 py-1 text-xs font-medium rounded-full border ${CONTENT_TYPE_COLORS[story.contentType]}`}>
                           {story.contentType}
                         </span>
                       </div>
@@ -424,7 +424,7 @@ export default function DashboardPage() {
 
                       {/* Content Type Tag */}
                       <div className="mb-3">
-                        <span className={`inline-block px-3 py-1 text-xs font-medium rounded-full border ${contentTypeColors[story.contentType]}`}>
+                        <span className={`inline-block px-3 py-1 text-xs font-medium rounded-full border ${CONTENT_TYPE_COLORS[story.contentType]}`}>
                           {story.contentType}
                         </span>
                       </div>
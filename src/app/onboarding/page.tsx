@@ -2,7 +2,7 @@
 
 import { useState, useEffect, useRef } from 'react'
 import { useRouter } from 'next/navigation'
-import { Eye, Sparkles, Loader2, ArrowRight, Info } from 'lucide-react'
+import { Sparkles, Loader2, ArrowRight, Info } from 'lucide-react'
 
 // Types
 type StepType = 'role' | 'industry' | 'team' | 'tasks' | 'tools' | 'problems' | 'preferences' | 'complete'
@@ -2,7 +2,7 @@
 
 import { useState } from 'react'
 import Link from 'next/link'
-import { Eye, Sparkles, Play, ArrowRight, Zap, Target, Clock, ChevronDown, Filter, Bot, FileText, CheckSquare, Check } from 'lucide-react'
+import { Eye, Sparkles, Play, ArrowRight, ChevronDown, Filter, Bot, FileText, CheckSquare, Check } from 'lucide-react'
 
 export default function LandingPage() {
   const [email, setEmail] = useState('')
@@ -16,14 +16,11 @@ import {
   Edit3,
   Check,
   X,
-  Mail,
   Briefcase,
   MapPin,
   Calendar,
-  Activity,
   BarChart3,
-  Clock,
-  Star
+  Clock
 } from 'lucide-react'
 
 export default function ProfilePage() {
@@ -9,18 +9,13 @@ import {
   Bookmark, 
   User, 
   Search,
-  Filter,
   Star,
-  Clock,
   Calendar,
   StickyNote,
-  ExternalLink,
   ArrowUpDown,
-  TrendingUp,
   Tag,
   Plus,
   FolderPlus,
-  ArrowRight,
   Sparkles,
   X,
   Flame
@@ -190,11 +185,13 @@ export default function SavedStoriesPage() {
     }
   ]
 
+  // Lowercase the query once rather than per story and per tag
+  const query = searchQuery.toLowerCase()
   const filteredStories = savedStories.filter(story => {
-    const matchesSearch = story.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         story.summary.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         story.tags.some(tag => tag.toLowerCase().includes(searchQuery.toLowerCase())) ||
-                         story.notes.toLowerCase().includes(searchQuery.toLowerCase())
+    const matchesSearch = story.title.toLowerCase().includes(query) ||
+                         story.summary.toLowerCase().includes(query) ||
+                         story.tags.some(tag => tag.toLowerCase().includes(query)) ||
+                         story.notes.toLowerCase().includes(query)
     
     const matchesCollection = selectedCollection === 'all' || story.collection === selectedCollection
     
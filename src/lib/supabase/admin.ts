@@ -2,18 +2,25 @@
 // ⚠️ NEVER import this file in client-side code!
 // Use only in API routes, server actions, or server-side operations
 
-import { createClient } from '@supabase/supabase-js'
+import { createClient, SupabaseClient } from '@supabase/supabase-js'
+
+// Reused across requests so warm server instances keep their connections
+// instead of building a fresh client on every call
+let adminClient: SupabaseClient | null = null
 
 export function createAdminClient() {
-  return createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.SUPABASE_SERVICE_ROLE_KEY!,
-    {
-      auth: {
-        autoRefreshToken: false,
-        persistSession: false
+  if (!adminClient) {
+    adminClient = createClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.SUPABASE_SERVICE_ROLE_KEY!,
+      {
+        auth: {
+          autoRefreshToken: false,
+          persistSession: false
+        }
       }
-    }
-  )
-}
+    )
+  }
 
+  return adminClient
+}